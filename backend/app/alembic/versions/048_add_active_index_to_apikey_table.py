@@ -0,0 +1,29 @@
+"""add active index to apikey table
+
+Revision ID: 048
+Revises: 047
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "048"
+down_revision = "047"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "idx_apikey_project_id_active",
+        "apikey",
+        ["project_id"],
+        unique=False,
+        postgresql_where=sa.text("is_deleted = false"),
+    )
+
+
+def downgrade():
+    op.drop_index("idx_apikey_project_id_active", table_name="apikey")
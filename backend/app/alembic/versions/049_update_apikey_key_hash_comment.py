@@ -0,0 +1,42 @@
+"""update apikey key_hash comment for hmac-sha256
+
+New API key hashes are HMAC-SHA256 digests keyed by the API_KEY_PEPPER
+setting. The pepper must stay fixed for the life of a deployment: changing
+it invalidates every API key hashed under the previous value. Legacy bcrypt
+hashes do not depend on it.
+
+Revision ID: 049
+Revises: 048
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "049"
+down_revision = "048"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column(
+        "apikey",
+        "key_hash",
+        existing_type=sa.VARCHAR(),
+        comment="HMAC-SHA256 hash of the secret of the API key (bcrypt for legacy keys)",
+        existing_comment="Bcrypt hash of the secret of the API key",
+        existing_nullable=False,
+    )
+
+
+def downgrade():
+    op.alter_column(
+        "apikey",
+        "key_hash",
+        existing_type=sa.VARCHAR(),
+        comment="Bcrypt hash of the secret of the API key",
+        existing_comment="HMAC-SHA256 hash of the secret of the API key (bcrypt for legacy keys)",
+        existing_nullable=False,
+    )
@@ -0,0 +1,27 @@
+"""add lookup index to collection table
+
+Revision ID: 050
+Revises: 049
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "050"
+down_revision = "049"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "idx_collection_project_id_llm_service",
+        "collection",
+        ["project_id", "llm_service_id", "llm_service_name"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("idx_collection_project_id_llm_service", table_name="collection")
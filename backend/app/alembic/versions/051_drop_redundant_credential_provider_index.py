@@ -0,0 +1,25 @@
+"""drop redundant provider index from credential table
+
+Revision ID: 051
+Revises: 050
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "051"
+down_revision = "050"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Every lookup filters on organization_id and project_id as well, which
+    # uq_credential_org_project_provider already covers
+    op.drop_index("ix_credential_provider", table_name="credential")
+
+
+def downgrade():
+    op.create_index("ix_credential_provider", "credential", ["provider"], unique=False)
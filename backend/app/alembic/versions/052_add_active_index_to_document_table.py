@@ -0,0 +1,29 @@
+"""add active index to document table
+
+Revision ID: 052
+Revises: 051
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "052"
+down_revision = "051"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "idx_document_project_id_active",
+        "document",
+        ["project_id"],
+        unique=False,
+        postgresql_where=sa.text("is_deleted = false"),
+    )
+
+
+def downgrade():
+    op.drop_index("idx_document_project_id_active", table_name="document")
@@ -1,10 +1,21 @@
 import re
+import time
+import asyncio
 import openai
 import requests
-
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    FastAPI,
+    HTTPException,
+    Request,
+)
 from openai import OpenAI
 from pydantic import BaseModel, Field
+from pydantic_core import to_json
 from typing import Optional
 
 from app.api.deps import AuthContextDep, SessionDep
@@ -20,6 +31,22 @@ from app.core.langfuse.langfuse import LangfuseTracer
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["Threads"])
 
+# Run statuses after which polling stops (mirrors the SDK's create_and_poll)
+RUN_TERMINAL_STATUSES = {
+    "completed",
+    "failed",
+    "cancelled",
+    "expired",
+    "incomplete",
+    "requires_action",
+}
+RUN_POLL_INITIAL_INTERVAL = 0.2
+RUN_POLL_MAX_INTERVAL = 5.0
+
+# Fixed-size worker pool for /threads background runs
+THREAD_RUN_WORKERS = 32
+THREAD_RUN_QUEUE_SIZE = 1024
+
 
 class StartThreadRequest(BaseModel):
     question: str = Field(..., description="The user's input question.")
@@ -33,13 +60,17 @@ class StartThreadRequest(BaseModel):
     )
 
 
-def send_callback(callback_url: str, data: dict):
+def send_callback(callback_url: str, data: dict | BaseModel):
     """Send results to the callback URL (synchronously)."""
     try:
         session = requests.Session()
         # uncomment this to run locally without SSL
         # session.verify = False
-        response = session.post(callback_url, json=data)
+        response = session.post(
+            callback_url,
+            data=to_json(data),
+            headers={"Content-Type": "application/json"},
+        )
         response.raise_for_status()
         logger.info(f"[send_callback] Callback sent successfully to {callback_url}")
         return True
@@ -55,32 +86,6 @@ def handle_openai_error(e: openai.OpenAIError) -> str:
     return str(e)
 
 
-def validate_thread(client: OpenAI, thread_id: str) -> tuple[bool, str]:
-    """Validate if a thread exists and has no active runs."""
-    if not thread_id:
-        return True, None
-
-    try:
-        runs = client.beta.threads.runs.list(thread_id=thread_id)
-        if runs.data and len(runs.data) > 0:
-            latest_run = runs.data[0]
-            if latest_run.status in ["queued", "in_progress", "requires_action"]:
-                logger.error(
-                    f"[validate_thread] Thread ID {mask_string(thread_id)} is currently {latest_run.status}."
-                )
-                return (
-                    False,
-                    f"There is an active run on this thread (status: {latest_run.status}). Please wait for it to complete.",
-                )
-        return True, None
-    except openai.OpenAIError as e:
-        logger.error(
-            f"[validate_thread] Failed to validate thread ID {mask_string(thread_id)}: {str(e)}",
-            exc_info=True,
-        )
-        return False, f"Invalid thread ID provided {thread_id}"
-
-
 def setup_thread(client: OpenAI, request: dict) -> tuple[bool, str]:
     """Set up thread and add message, either creating new or using existing."""
     thread_id = request.get("thread_id")
@@ -93,6 +98,23 @@ def setup_thread(client: OpenAI, request: dict) -> tuple[bool, str]:
                 f"[setup_thread] Added message to existing thread {mask_string(thread_id)}"
             )
             return True, None
+        except openai.BadRequestError as e:
+            # OpenAI rejects new messages while a run is active, so this replaces
+            # a separate runs.list round-trip before every message
+            error_message = handle_openai_error(e)
+            if "while a run" in error_message and "is active" in error_message:
+                logger.error(
+                    f"[setup_thread] Thread ID {mask_string(thread_id)} has an active run."
+                )
+                return (
+                    False,
+                    "There is an active run on this thread. Please wait for it to complete.",
+                )
+            logger.error(
+                f"[setup_thread] Failed to add message to existing thread {mask_string(thread_id)}: {str(e)}",
+                exc_info=True,
+            )
+            return False, error_message
         except openai.OpenAIError as e:
             logger.error(
                 f"[setup_thread] Failed to add message to existing thread {mask_string(thread_id)}: {str(e)}",
@@ -148,11 +170,18 @@ def create_success_response(request: dict, message: str) -> APIResponse:
 
 
 def run_and_poll_thread(client: OpenAI, thread_id: str, assistant_id: str):
-    """Runs and polls a thread with the specified assistant using the OpenAI client."""
-    return client.beta.threads.runs.create_and_poll(
+    """Runs a thread with the specified assistant and polls it until it reaches a
+    terminal status, backing off exponentially between retrieves."""
+    run = client.beta.threads.runs.create(
         thread_id=thread_id,
         assistant_id=assistant_id,
     )
+    interval = RUN_POLL_INITIAL_INTERVAL
+    while run.status not in RUN_TERMINAL_STATUSES:
+        time.sleep(interval)
+        interval = min(interval * 2, RUN_POLL_MAX_INTERVAL)
+        run = client.beta.threads.runs.retrieve(thread_id=thread_id, run_id=run.id)
+    return run
 
 
 def extract_response_from_thread(
@@ -167,7 +196,7 @@ def extract_response_from_thread(
 
 def process_run_core(
     request: dict, client: OpenAI, tracer: LangfuseTracer
-) -> tuple[dict, str]:
+) -> tuple[APIResponse, str]:
     """Core function to process a run and return the response and message with Langfuse tracing."""
     tracer.start_generation(
         name="openai_thread_run",
@@ -179,10 +208,7 @@ def process_run_core(
         logger.info(
             f"[process_run_core] Starting run for thread ID: {mask_string(request.get('thread_id'))} with assistant ID: {mask_string(request.get('assistant_id'))}"
         )
-        run = client.beta.threads.runs.create_and_poll(
-            thread_id=request["thread_id"],
-            assistant_id=request["assistant_id"],
-        )
+        run = run_and_poll_thread(client, request["thread_id"], request["assistant_id"])
 
         if run.status == "completed":
             message = extract_response_from_thread(
@@ -215,14 +241,14 @@ def process_run_core(
             logger.info(
                 f"[process_run_core] Run completed successfully for thread ID: {mask_string(request.get('thread_id'))}"
             )
-            return create_success_response(request, message).model_dump(), None
+            return create_success_response(request, message), None
         else:
             error_msg = f"Run failed with status: {run.status}"
             logger.error(
                 f"[process_run_core] Run failed with error: {run.last_error} for thread ID: {mask_string(request.get('thread_id'))}"
             )
             tracer.log_error(error_msg)
-            return APIResponse.failure_response(error=error_msg).model_dump(), error_msg
+            return APIResponse.failure_response(error=error_msg), error_msg
 
     except openai.OpenAIError as e:
         error_msg = handle_openai_error(e)
@@ -231,7 +257,7 @@ def process_run_core(
             f"[process_run_core] OpenAI error: {error_msg} for thread ID: {mask_string(request.get('thread_id'))}",
             exc_info=True,
         )
-        return APIResponse.failure_response(error=error_msg).model_dump(), error_msg
+        return APIResponse.failure_response(error=error_msg), error_msg
     finally:
         tracer.flush()
 
@@ -242,6 +268,56 @@ def process_run(request: dict, client: OpenAI, tracer: LangfuseTracer):
     send_callback(request["callback_url"], response)
 
 
+async def thread_run_worker(queue: asyncio.Queue, executor: ThreadPoolExecutor) -> None:
+    """Consume queued thread runs, processing one at a time on the run executor."""
+    loop = asyncio.get_running_loop()
+    while True:
+        request, client, tracer = await queue.get()
+        try:
+            await loop.run_in_executor(executor, process_run, request, client, tracer)
+        except Exception as e:
+            logger.error(
+                f"[thread_run_worker] Failed to process run for thread ID: {mask_string(request.get('thread_id'))}: {str(e)}",
+                exc_info=True,
+            )
+        finally:
+            queue.task_done()
+
+
+def start_thread_run_workers(app: FastAPI) -> list[asyncio.Task]:
+    """Create the shared thread-run queue and executor on app state and spawn
+    their workers. A dedicated executor keeps run capacity independent of the
+    event loop's default pool."""
+    app.state.thread_run_queue = asyncio.Queue(maxsize=THREAD_RUN_QUEUE_SIZE)
+    app.state.thread_run_executor = ThreadPoolExecutor(
+        max_workers=THREAD_RUN_WORKERS, thread_name_prefix="thread-run"
+    )
+    return [
+        asyncio.create_task(
+            thread_run_worker(app.state.thread_run_queue, app.state.thread_run_executor)
+        )
+        for _ in range(THREAD_RUN_WORKERS)
+    ]
+
+
+async def stop_thread_run_workers(app: FastAPI, workers: list[asyncio.Task]) -> None:
+    """Cancel the workers and log every queued run that will not be processed.
+    Runs already handed to the executor are left to finish."""
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+
+    queue = app.state.thread_run_queue
+    while not queue.empty():
+        request, _, _ = queue.get_nowait()
+        queue.task_done()
+        logger.warning(
+            f"[stop_thread_run_workers] Dropping queued run on shutdown for thread ID: {mask_string(request.get('thread_id'))}"
+        )
+
+    app.state.thread_run_executor.shutdown(wait=False)
+
+
 def poll_run_and_prepare_response(request: dict, client: OpenAI, db: SessionDep):
     """Handles a thread run, processes the response, and upserts the result to the database."""
     thread_id = request["thread_id"]
@@ -292,7 +368,7 @@ def poll_run_and_prepare_response(request: dict, client: OpenAI, db: SessionDep)
 )
 async def threads(
     request: dict,
-    background_tasks: BackgroundTasks,
+    http_request: Request,
     _session: SessionDep,
     _current_user: AuthContextDep,
 ):
@@ -319,11 +395,7 @@ async def threads(
         project_id=request.get("project_id"),
     )
 
-    # Validate thread
-    is_valid, error_message = validate_thread(client, request.get("thread_id"))
-    if not is_valid:
-        raise Exception(error_message)
-    # Setup thread
+    # Setup thread (fails fast if the existing thread has an active run)
     is_success, error_message = setup_thread(client, request)
     if not is_success:
         raise Exception(error_message)
@@ -351,10 +423,10 @@ async def threads(
         },
         metadata={"thread_id": request["thread_id"]},
     )
-    # Schedule background task
-    background_tasks.add_task(process_run, request, client, tracer)
+    # Hand the run to the shared worker pool
+    await http_request.app.state.thread_run_queue.put((request, client, tracer))
     logger.info(
-        f"[threads] Background task scheduled for thread ID: {mask_string(request.get('thread_id'))} | organization_id: {_current_user.organization_.id}, project_id: {request.get('project_id')}"
+        f"[threads] Run queued for thread ID: {mask_string(request.get('thread_id'))} | organization_id: {_current_user.organization_.id}, project_id: {request.get('project_id')}"
     )
     return initial_response
 
@@ -394,12 +466,7 @@ async def threads_sync(
         project_id=request.get("project_id"),
     )
 
-    # Validate thread
-    is_valid, error_message = validate_thread(client, request.get("thread_id"))
-    if not is_valid:
-        raise Exception(error_message)
-
-    # Setup thread
+    # Setup thread (fails fast if the existing thread has an active run)
     is_success, error_message = setup_thread(client, request)
     if not is_success:
         raise Exception(error_message)
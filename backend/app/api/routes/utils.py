@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from pydantic.networks import EmailStr
 
 from app.models import Message
@@ -28,5 +28,7 @@ def test_email(email_to: EmailStr) -> Message:
 
 
 @router.get("/health/", include_in_schema=False)
-async def health_check() -> bool:
-    return True
+async def health_check() -> Response:
+    # A raw Response lets load-balancer probes skip response validation and
+    # serialization; build one per request since FastAPI mutates it
+    return Response(content=b"true", media_type="application/json")
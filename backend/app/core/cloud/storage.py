@@ -4,7 +4,7 @@ from uuid import UUID
 import logging
 import functools as ft
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from urllib.parse import ParseResult, urlparse, urlunparse
 
 from abc import ABC, abstractmethod
@@ -89,17 +89,15 @@ class SimpleStorageName:
     Bucket: str = settings.AWS_S3_BUCKET
 
     def __str__(self):
+        return self._url
+
+    @ft.cached_property
+    def _url(self) -> str:
+        # Instances are frozen, so the rendered URL can be computed once
         return urlunparse(self.to_url())
 
     def to_url(self):
-        kwargs = {
-            "scheme": "s3",
-            "netloc": self.Bucket,
-            "path": self.Key,
-        }
-        for k in ParseResult._fields:
-            kwargs.setdefault(k)
-        return ParseResult(**kwargs)
+        return ParseResult("s3", self.Bucket, self.Key, "", "", "")
 
     @classmethod
     def from_url(cls, url: str):
@@ -149,37 +147,38 @@ class AmazonCloudStorage(CloudStorage):
     def put(self, source: UploadFile, file_path: Path) -> SimpleStorageName:
         if file_path.is_absolute():
             raise ValueError("file_path must be relative to the project's storage root")
-        key = Path(self.storage_path) / file_path
-        destination = SimpleStorageName(key.as_posix())
-        kwargs = asdict(destination)
+        bucket = settings.AWS_S3_BUCKET
+        key = (Path(self.storage_path) / file_path).as_posix()
 
         try:
             self.aws.client.upload_fileobj(
                 source.file,
+                Bucket=bucket,
+                Key=key,
                 ExtraArgs={
                     "ContentType": source.content_type,
                 },
-                **kwargs,
             )
             logger.info(
                 f"[AmazonCloudStorage.put] File uploaded successfully | "
-                f"{{'project_id': '{self.project_id}', 'bucket': '{mask_string(destination.Bucket)}', 'key': '{mask_string(destination.Key)}'}}"
+                f"{{'project_id': '{self.project_id}', 'bucket': '{mask_string(bucket)}', 'key': '{mask_string(key)}'}}"
             )
         except ClientError as err:
             logger.error(
                 f"[AmazonCloudStorage.put] AWS upload error | "
-                f"{{'project_id': '{self.project_id}', 'bucket': '{mask_string(destination.Bucket)}', 'key': '{mask_string(destination.Key)}', 'error': '{str(err)}'}}",
+                f"{{'project_id': '{self.project_id}', 'bucket': '{mask_string(bucket)}', 'key': '{mask_string(key)}', 'error': '{str(err)}'}}",
                 exc_info=True,
             )
             raise CloudStorageError(f'AWS Error: "{err}"') from err
 
-        return destination
+        return SimpleStorageName(Key=key, Bucket=bucket)
 
     def stream(self, url: str) -> StreamingBody:
         name = SimpleStorageName.from_url(url)
-        kwargs = asdict(name)
         try:
-            body = self.aws.client.get_object(**kwargs).get("Body")
+            body = self.aws.client.get_object(Bucket=name.Bucket, Key=name.Key).get(
+                "Body"
+            )
             logger.info(
                 f"[AmazonCloudStorage.stream] File streamed successfully | "
                 f"{{'project_id': '{self.project_id}', 'bucket': '{mask_string(name.Bucket)}', 'key': '{mask_string(name.Key)}'}}"
@@ -195,9 +194,8 @@ class AmazonCloudStorage(CloudStorage):
 
     def get_file_size_kb(self, url: str) -> float:
         name = SimpleStorageName.from_url(url)
-        kwargs = asdict(name)
         try:
-            response = self.aws.client.head_object(**kwargs)
+            response = self.aws.client.head_object(Bucket=name.Bucket, Key=name.Key)
             size_bytes = response["ContentLength"]
             size_kb = round(size_bytes / 1024, 2)
             logger.info(
@@ -248,9 +246,8 @@ class AmazonCloudStorage(CloudStorage):
 
     def delete(self, url: str) -> None:
         name = SimpleStorageName.from_url(url)
-        kwargs = asdict(name)
         try:
-            self.aws.client.delete_object(**kwargs)
+            self.aws.client.delete_object(Bucket=name.Bucket, Key=name.Key)
             logger.info(
                 f"[AmazonCloudStorage.delete] File deleted successfully | "
                 f"{{'project_id': '{self.project_id}', 'bucket': '{mask_string(name.Bucket)}', 'key': '{mask_string(name.Key)}'}}"
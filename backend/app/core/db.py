@@ -20,6 +20,11 @@ def get_engine():
         max_overflow=max_overflow,
         pool_pre_ping=True,
         pool_recycle=300,  # Recycle connections after 5 minutes
+        # Reuse the most recently returned connection so idle ones age out
+        # via pool_recycle instead of being cycled through round-robin
+        pool_use_lifo=True,
+        # Headroom over the default 500 compiled statements
+        query_cache_size=1200,
     )
 
 
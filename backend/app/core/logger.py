@@ -1,6 +1,8 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from asgi_correlation_id import correlation_id
 from app.core.config import settings
 
@@ -37,10 +39,19 @@ stream_handler.setFormatter(formatter)
 stream_handler.addFilter(CorrelationIdFilter())
 logger.addHandler(stream_handler)
 
-# Rotating file handler
+# Rotating file handler, drained by a background listener so request threads
+# never block on disk I/O or rotation. The correlation id filter runs on the
+# queue handler because the contextvar is only visible in the calling thread.
 file_handler = RotatingFileHandler(
     LOG_FILE_PATH, maxBytes=10 * 1024 * 1024, backupCount=5
 )
 file_handler.setFormatter(formatter)
-file_handler.addFilter(CorrelationIdFilter())
-logger.addHandler(file_handler)
+
+log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+queue_handler = QueueHandler(log_queue)
+queue_handler.addFilter(CorrelationIdFilter())
+logger.addHandler(queue_handler)
+
+queue_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+queue_listener.start()
+atexit.register(queue_listener.stop)
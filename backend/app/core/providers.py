@@ -1,7 +1,8 @@
+import functools
 import logging
 from typing import Dict, List, Optional
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,10 @@ class ProviderConfig:
     """Configuration for a provider including its required credential fields."""
 
     required_fields: List[str]
+    required_field_set: frozenset[str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.required_field_set = frozenset(self.required_fields)
 
 
 # Provider configurations
@@ -35,6 +40,7 @@ PROVIDER_CONFIGS: Dict[Provider, ProviderConfig] = {
 }
 
 
+@functools.lru_cache(maxsize=64)
 def validate_provider(provider: str) -> Provider:
     """Validate that the provider name is supported and return the Provider enum.
 
@@ -70,11 +76,11 @@ def validate_provider_credentials(provider: str, credentials: Dict[str, str]) ->
         ValueError: If required fields are missing from the credentials
     """
     provider_enum = validate_provider(provider)
-    required_fields = PROVIDER_CONFIGS[provider_enum].required_fields
+    config = PROVIDER_CONFIGS[provider_enum]
 
-    if missing_fields := [
-        field for field in required_fields if field not in credentials
-    ]:
+    if missing := config.required_field_set - credentials.keys():
+        # Report in declaration order so error messages stay deterministic
+        missing_fields = [f for f in config.required_fields if f in missing]
         logger.error(
             f"[validate_provider_credentials] Missing required fields | provider: {provider}, missing_fields: {', '.join(missing_fields)}"
         )
@@ -8,6 +8,8 @@ This module provides utilities for:
 """
 
 import base64
+import hashlib
+import hmac
 import json
 import logging
 import secrets
@@ -22,6 +24,7 @@ from passlib.context import CryptContext
 from sqlmodel import Session, and_, select
 
 from app.models import APIKey, User, Organization, Project, AuthContext
+from app.core.cache import TTLCache
 from app.core.config import settings
 
 
@@ -158,7 +161,9 @@ class APIKeyManager:
     - **Old Format (Legacy)**: 43 chars after "ApiKey ", with 12-char prefix and 31-char secret.
     - **New Format (Current)**: 65 chars after "ApiKey ", with 22-char prefix and 43-char secret.
     - Generates cryptographically secure API keys with fixed lengths,
-    storing only the hashed secret using bcrypt while keeping the prefix in plaintext for quick lookup.
+    storing only an HMAC-SHA256 of the secret while keeping the prefix in plaintext for quick lookup.
+    Secrets are 256-bit random tokens, so a slow password hash adds latency without adding security.
+    Keys hashed with bcrypt before the switch are still verified.
     Raw keys are displayed only once during creation for security.
     The system automatically verifies both old and new key formats to ensure backward compatibility.
 
@@ -172,9 +177,19 @@ class APIKeyManager:
     SECRET_BYTES = 32  # Generates 43 chars in urlsafe base64
     PREFIX_LENGTH = 22
     KEY_LENGTH = 65  # Total length: 22 (prefix) + 43 (secret)
-    HASH_ALGORITHM = "bcrypt"
+    HASH_ALGORITHM = "hmac-sha256"
+    LEGACY_HASH_PREFIX = "$2"  # bcrypt hashes: $2a$, $2b$, $2y$
 
-    pwd_context = CryptContext(schemes=[HASH_ALGORITHM], deprecated="auto")
+    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+    # Successful legacy bcrypt verifications are remembered for a short time so bursts
+    # of requests with the same key skip the hash. Entries are keyed by a digest
+    # of the secret plus the stored hash, so the raw key is never kept and a
+    # deleted or rotated key stops matching on the next lookup.
+    VERIFY_CACHE_SIZE = 1024
+    VERIFY_CACHE_TTL = 60  # seconds
+
+    _verify_cache = TTLCache(maxsize=VERIFY_CACHE_SIZE, ttl=VERIFY_CACHE_TTL)
 
     @classmethod
     def generate(cls) -> Tuple[str, str, str]:
@@ -197,7 +212,7 @@ class APIKeyManager:
         # Construct raw key: "ApiKey {prefix}{secret}"
         raw_key = f"{cls.PREFIX_NAME}{key_prefix}{secret_key}"
 
-        key_hash = cls.pwd_context.hash(secret_key)
+        key_hash = cls._hash_secret(secret_key)
 
         return raw_key, key_prefix, key_hash
 
@@ -234,6 +249,40 @@ class APIKeyManager:
         # Invalid format
         return None
 
+    @classmethod
+    def _hash_secret(cls, secret: str) -> str:
+        """
+        Hash an API key secret with HMAC-SHA256 keyed by API_KEY_PEPPER.
+
+        Returns:
+            str: Hex-encoded digest
+        """
+        return hmac.new(
+            settings.API_KEY_PEPPER.encode(), secret.encode(), hashlib.sha256
+        ).hexdigest()
+
+    @classmethod
+    def _verify_secret(cls, secret: str, key_hash: str) -> bool:
+        """
+        Check a secret against its stored hash in constant time. Legacy bcrypt
+        hashes fall back to bcrypt, reusing recent successful checks.
+
+        Returns:
+            bool: True if the secret matches the hash
+        """
+        if not key_hash.startswith(cls.LEGACY_HASH_PREFIX):
+            return hmac.compare_digest(cls._hash_secret(secret), key_hash)
+
+        cache_key = (hashlib.sha256(secret.encode()).hexdigest(), key_hash)
+        if cls._verify_cache.get(cache_key):
+            return True
+
+        if not cls.pwd_context.verify(secret, key_hash):
+            return False
+
+        cls._verify_cache.set(cache_key, True)
+        return True
+
     @classmethod
     def verify(cls, session: Session, raw_key: str) -> AuthContext | None:
         """
@@ -283,7 +332,7 @@ class APIKeyManager:
             )
 
             # Verify the secret hash
-            if cls.pwd_context.verify(secret, api_key_record.key_hash):
+            if cls._verify_secret(secret, api_key_record.key_hash):
                 return auth_context
 
             return None
@@ -108,11 +108,9 @@ class APIKeyCrud:
         api_key.is_deleted = True
         api_key.deleted_at = now()
         api_key.updated_at = now()
-        self.session.add(api_key)
         self.session.commit()
-        self.session.refresh(api_key)
 
         logger.info(
             f"[APIKeyCrud.delete_api_key] API key deleted successfully | "
-            f"{{'api_key_id': '{api_key.id}', 'project_id': {self.project_id}}}"
+            f"{{'api_key_id': '{key_id}', 'project_id': {self.project_id}}}"
         )
@@ -1,12 +1,15 @@
 import logging
 import functools as ft
+from concurrent.futures import ThreadPoolExecutor
 from uuid import UUID
 from typing import Optional
 import logging
 
 from fastapi import HTTPException
 from sqlmodel import Session, select, and_
+from sqlalchemy import exists, update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import raiseload
 
 from app.models import Document, Collection, DocumentCollection
 from app.core.util import now
@@ -14,6 +17,9 @@ from app.crud.document_collection import DocumentCollectionCrud
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent remote deletions when a document is removed
+REMOTE_DELETE_WORKERS = 8
+
 
 class CollectionCrud:
     def __init__(self, session: Session, project_id: int):
@@ -31,14 +37,14 @@ class CollectionCrud:
         return collection
 
     def _exists(self, collection: Collection) -> bool:
-        stmt = select(Collection.id).where(
-            (Collection.project_id == self.project_id)
-            & (Collection.llm_service_id == collection.llm_service_id)
-            & (Collection.llm_service_name == collection.llm_service_name)
+        stmt = select(
+            exists().where(
+                (Collection.project_id == self.project_id)
+                & (Collection.llm_service_id == collection.llm_service_id)
+                & (Collection.llm_service_name == collection.llm_service_name)
+            )
         )
-        present = self.session.exec(stmt).scalar_one_or_none() is not None
-
-        return present
+        return self.session.exec(stmt).one()
 
     def create(
         self, collection: Collection, documents: list[Document] | None = None
@@ -83,31 +89,59 @@ class CollectionCrud:
         return collection
 
     def read_all(self):
-        statement = select(Collection).where(
-            and_(
-                Collection.project_id == self.project_id,
-                Collection.deleted_at.is_(None),
+        # Listing only reads column attributes; raise rather than lazily
+        # load Collection.project once per row
+        statement = (
+            select(Collection)
+            .where(
+                and_(
+                    Collection.project_id == self.project_id,
+                    Collection.deleted_at.is_(None),
+                )
             )
+            .options(raiseload("*"))
         )
 
         collections = self.session.exec(statement).all()
         return collections
 
     def exists_by_name(self, collection_name: str) -> bool:
-        statement = (
-            select(Collection.id)
+        statement = select(
+            exists()
             .where(Collection.project_id == self.project_id)
             .where(Collection.name == collection_name)
             .where(Collection.deleted_at.is_(None))
         )
-        result = self.session.exec(statement).first()
-        return result is not None
+        return self.session.exec(statement).one()
 
     def delete_by_id(self, collection_id: UUID) -> Collection:
-        coll = self.read_one(collection_id)
-        coll.deleted_at = now()
+        # One UPDATE ... RETURNING instead of read, update and refresh
+        statement = (
+            update(Collection)
+            .where(
+                Collection.project_id == self.project_id,
+                Collection.id == collection_id,
+                Collection.deleted_at.is_(None),
+            )
+            .values(deleted_at=now())
+            .returning(Collection)
+        )
+        collection = self.session.exec(statement).scalar_one_or_none()
+        if collection is None:
+            logger.warning(
+                "[CollectionCrud.delete_by_id] Collection not found | "
+                f"{{'project_id': '{self.project_id}', 'collection_id': '{collection_id}'}}"
+            )
+            raise HTTPException(
+                status_code=404,
+                detail="Collection not found",
+            )
 
-        return self._update(coll)
+        self.session.commit()
+        logger.info(
+            f"[CollectionCrud.delete_by_id] Collection deleted successfully | {{'collection_id': '{collection_id}'}}"
+        )
+        return collection
 
     @ft.singledispatchmethod
     def delete(self, model, remote):  # remote should be an OpenAICrud
@@ -145,11 +179,32 @@ class CollectionCrud:
             .distinct()
         )
 
-        for coll in self.session.exec(statement):
-            self.delete(coll, remote)
+        collections = self.session.exec(statement).all()
+        deleted_at = now()
+        error = None
+        with ThreadPoolExecutor(max_workers=REMOTE_DELETE_WORKERS) as executor:
+            futures = [
+                (coll, executor.submit(remote.delete, coll.llm_service_id))
+                for coll in collections
+            ]
+        for coll, future in futures:
+            exc = future.exception()
+            if exc is None:
+                coll.deleted_at = deleted_at
+                self.session.add(coll)
+            else:
+                logger.error(
+                    f"[CollectionCrud.delete] Remote deletion failed | {{'collection_id': '{coll.id}', 'error': '{exc}'}}"
+                )
+                error = error or exc
+        # Single commit for the whole batch; collections whose remote
+        # resources are already gone are persisted even if others failed
+        self.session.commit()
+        if error is not None:
+            raise error
         self.session.refresh(model)
         logger.info(
-            f"[CollectionCrud.delete] Document deletion from collections completed | {{'document_id': '{model.id}'}}"
+            f"[CollectionCrud.delete] Document deletion from collections completed | {{'document_id': '{model.id}', 'collection_count': {len(collections)}}}"
         )
 
         return model
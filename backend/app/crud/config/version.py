@@ -5,7 +5,7 @@ from typing import Any
 from sqlmodel import Session, select, and_, func
 from fastapi import HTTPException
 from sqlalchemy.orm import defer
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from .config import ConfigCrud
 from app.core.util import now
@@ -20,6 +20,10 @@ from app.models.llm.request import ConfigBlob
 
 logger = logging.getLogger(__name__)
 
+# Validates a whole page of rows in one call rather than one model_validate
+# per row
+_version_items_adapter = TypeAdapter(list[ConfigVersionItems])
+
 
 class ConfigVersionCrud:
     """
@@ -202,7 +206,7 @@ class ConfigVersionCrud:
             .limit(limit)
         )
         results = self.session.exec(statement).all()
-        return [ConfigVersionItems.model_validate(item) for item in results]
+        return _version_items_adapter.validate_python(results, from_attributes=True)
 
     def delete_or_raise(self, version_number: int) -> None:
         """
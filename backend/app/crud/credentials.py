@@ -1,10 +1,12 @@
 import logging
 from typing import Any
 
-from sqlalchemy import delete
+from sqlalchemy import delete, update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import raiseload
 from sqlmodel import Session, select
 
+from app.core.cache import TTLCache
 from app.core.exception_handlers import HTTPException
 from app.core.providers import validate_provider, validate_provider_credentials
 from app.core.security import decrypt_credentials, encrypt_credentials
@@ -13,59 +15,95 @@ from app.models import Credential, CredsCreate, CredsUpdate
 
 logger = logging.getLogger(__name__)
 
+# Decrypted provider credentials keyed by (org_id, project_id, provider).
+# Writes in this process invalidate their entries; other workers may serve
+# the previous credentials for up to the TTL.
+CREDENTIAL_CACHE_TTL = 60  # seconds
+_credential_cache = TTLCache(maxsize=1024, ttl=CREDENTIAL_CACHE_TTL)
+
+
+def invalidate_credential_cache(
+    org_id: int, project_id: int, provider: str | None = None
+) -> None:
+    """Drop cached credentials for a project, optionally for a single provider."""
+    if provider is not None:
+        _credential_cache.pop((org_id, project_id, provider))
+        return
+    _credential_cache.invalidate(lambda key: key[:2] == (org_id, project_id))
+
+
+def clear_credential_cache() -> None:
+    """Drop all cached credentials."""
+    _credential_cache.clear()
+
 
 def set_creds_for_org(
     *, session: Session, creds_add: CredsCreate, organization_id: int, project_id: int
 ) -> list[Credential]:
-    """Set credentials for an organization. Creates a separate row for each provider."""
-    created_credentials = []
+    """Set credentials for an organization. Creates a separate row for each provider.
 
+    Every provider is validated before anything is written. Each row is then
+    inserted under its own savepoint, so a provider that already exists is
+    skipped without discarding the others, and the rest are committed once.
+    """
     if not creds_add.credential:
         logger.error(
             f"[set_creds_for_org] No credentials provided | project_id: {project_id}"
         )
         raise HTTPException(400, "No credentials provided")
 
+    credentials_to_add = []
     for provider, credentials in creds_add.credential.items():
         # Validate provider and credentials
         validate_provider(provider)
         validate_provider_credentials(provider, credentials)
 
-        # Encrypt entire credentials object
-        encrypted_credentials = encrypt_credentials(credentials)
-
-        # Create a row for each provider
-        credential = Credential(
-            organization_id=organization_id,
-            project_id=project_id,
-            is_active=creds_add.is_active,
-            provider=provider,
-            credential=encrypted_credentials,
+        # Encrypt entire credentials object and create a row for each provider
+        credentials_to_add.append(
+            Credential(
+                organization_id=organization_id,
+                project_id=project_id,
+                is_active=creds_add.is_active,
+                provider=provider,
+                credential=encrypt_credentials(credentials),
+            )
         )
-        credential.inserted_at = now()
+
+    created_credentials = []
+    failed: dict[str, IntegrityError] = {}
+    for credential in credentials_to_add:
         try:
-            session.add(credential)
-            session.commit()
-            session.refresh(credential)
-            created_credentials.append(credential)
+            with session.begin_nested():
+                session.add(credential)
         except IntegrityError as e:
-            session.rollback()
             logger.error(
-                f"[set_creds_for_org] Integrity error while adding credentials | organization_id {organization_id}, project_id {project_id}, provider {provider}: {str(e)}",
+                f"[set_creds_for_org] Integrity error while adding credentials | organization_id {organization_id}, project_id {project_id}, provider {credential.provider}: {str(e)}",
                 exc_info=True,
             )
-            # Check if it's a duplicate constraint violation
-            if (
-                "uq_credential_org_project_provider" in str(e)
-                or "unique constraint" in str(e).lower()
-            ):
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Credentials for provider '{provider}' already exist for this organization and project combination",
-                )
-            raise ValueError(
-                f"Error while adding credentials for provider {provider}: {str(e)}"
+            failed[credential.provider] = e
+            continue
+        created_credentials.append(credential)
+
+    # One commit for every provider that was inserted
+    session.commit()
+    invalidate_credential_cache(organization_id, project_id)
+
+    if failed:
+        providers = ", ".join(f"'{provider}'" for provider in failed)
+        # Check if it's a duplicate constraint violation
+        if all(
+            "uq_credential_org_project_provider" in str(e)
+            or "unique constraint" in str(e).lower()
+            for e in failed.values()
+        ):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Credentials for provider {providers} already exist for this organization and project combination",
             )
+        raise ValueError(
+            f"Error while adding credentials for provider {providers}: {next(iter(failed.values()))}"
+        )
+
     logger.info(
         f"[set_creds_for_org] Successfully created credentials | organization_id {organization_id}, project_id {project_id}"
     )
@@ -80,18 +118,17 @@ def get_key_by_org(
     provider: str = "openai",
 ) -> str | None:
     """Fetches the API key from the credentials for the given organization and provider."""
-    statement = select(Credential).where(
+    statement = select(Credential.credential).where(
         Credential.organization_id == org_id,
         Credential.provider == provider,
         Credential.is_active.is_(True),
         Credential.project_id == project_id,
     )
-    creds = session.exec(statement).one_or_none()
+    encrypted_credentials = session.exec(statement).one_or_none()
+    if not encrypted_credentials:
+        return None
 
-    if creds and creds.credential and "api_key" in creds.credential:
-        return creds.credential["api_key"]
-
-    return None
+    return decrypt_credentials(encrypted_credentials).get("api_key")
 
 
 def get_creds_by_org(
@@ -110,9 +147,15 @@ def get_creds_by_org(
     Raises:
         HTTPException: If no credentials are found
     """
-    statement = select(Credential).where(
-        Credential.organization_id == org_id,
-        Credential.project_id == project_id,
+    # Callers only read column attributes; fail loudly instead of issuing
+    # a lazy SELECT per row if a relationship is ever touched
+    statement = (
+        select(Credential)
+        .where(
+            Credential.organization_id == org_id,
+            Credential.project_id == project_id,
+        )
+        .options(raiseload("*"))
     )
     creds = session.exec(statement).all()
     return creds
@@ -146,6 +189,10 @@ def get_provider_credential(
     """
     validate_provider(provider)
 
+    cache_key = (org_id, project_id, provider)
+    if not full and (cached := _credential_cache.get(cache_key)) is not None:
+        return dict(cached)
+
     statement = select(Credential).where(
         Credential.organization_id == org_id,
         Credential.provider == provider,
@@ -154,15 +201,22 @@ def get_provider_credential(
     creds = session.exec(statement).one_or_none()
 
     if creds and creds.credential:
-        return creds if full else decrypt_credentials(creds.credential)
+        if full:
+            return creds
+        decrypted = decrypt_credentials(creds.credential)
+        _credential_cache.set(cache_key, decrypted)
+        return dict(decrypted)
 
     return None
 
 
 def get_providers(*, session: Session, org_id: int, project_id: int) -> list[str]:
     """Returns a list of all active providers for which credentials are stored."""
-    creds = get_creds_by_org(session=session, org_id=org_id, project_id=project_id)
-    return [cred.provider for cred in creds]
+    statement = select(Credential.provider).where(
+        Credential.organization_id == org_id,
+        Credential.project_id == project_id,
+    )
+    return list(session.exec(statement).all())
 
 
 def update_creds_for_org(
@@ -182,13 +236,19 @@ def update_creds_for_org(
     # Encrypt the entire credentials object
     encrypted_credentials = encrypt_credentials(creds_in.credential)
 
-    statement = select(Credential).where(
-        Credential.organization_id == org_id,
-        Credential.provider == creds_in.provider,
-        Credential.is_active.is_(True),
-        Credential.project_id == project_id,
+    # UPDATE ... RETURNING replaces the SELECT-then-UPDATE round trips
+    statement = (
+        update(Credential)
+        .where(
+            Credential.organization_id == org_id,
+            Credential.provider == creds_in.provider,
+            Credential.is_active.is_(True),
+            Credential.project_id == project_id,
+        )
+        .values(credential=encrypted_credentials, updated_at=now())
+        .returning(Credential)
     )
-    creds = session.exec(statement).one_or_none()
+    creds = session.exec(statement).scalar_one_or_none()
     if creds is None:
         logger.error(
             f"[update_creds_for_org] Credentials not found | organization {org_id}, provider {creds_in.provider}, project_id {project_id}"
@@ -197,11 +257,8 @@ def update_creds_for_org(
             status_code=404, detail="Credentials not found for this provider"
         )
 
-    creds.credential = encrypted_credentials
-    creds.updated_at = now()
-    session.add(creds)
     session.commit()
-    session.refresh(creds)
+    invalidate_credential_cache(org_id, project_id, creds_in.provider)
     logger.info(
         f"[update_creds_for_org] Successfully updated credentials | organization_id {org_id}, provider {creds_in.provider}, project_id {project_id}"
     )
@@ -214,43 +271,24 @@ def remove_provider_credential(
     """Remove credentials for a specific provider.
 
     Raises:
-        HTTPException: If credentials not found or deletion fails
+        HTTPException: If credentials not found
     """
     validate_provider(provider)
 
-    # Verify credentials exist before attempting delete
-    creds = get_provider_credential(
-        session=session,
-        org_id=org_id,
-        project_id=project_id,
-        provider=provider,
-    )
-    if creds is None:
-        raise HTTPException(
-            status_code=404, detail="Credentials not found for this provider"
-        )
-
-    # Build delete statement
+    # A single DELETE; its rowcount doubles as the existence check
     statement = delete(Credential).where(
         Credential.organization_id == org_id,
         Credential.provider == provider,
         Credential.project_id == project_id,
     )
-
-    # Execute and get affected rows
     result = session.exec(statement)
 
-    rows_deleted = result.rowcount
-    if rows_deleted == 0:
-        session.rollback()
-        logger.error(
-            f"[remove_provider_credential] Failed to delete credential | organization_id {org_id}, provider {provider}, project_id {project_id}"
-        )
+    if result.rowcount == 0:
         raise HTTPException(
-            status_code=500,
-            detail="Failed to delete provider credential",
+            status_code=404, detail="Credentials not found for this provider"
         )
     session.commit()
+    invalidate_credential_cache(org_id, project_id, provider)
     logger.info(
         f"[remove_provider_credential] Successfully deleted credential | provider {provider}, organization_id {org_id}, project_id {project_id}"
     )
@@ -260,19 +298,9 @@ def remove_creds_for_org(*, session: Session, org_id: int, project_id: int) -> N
     """Removes all credentials for an organization.
 
     Raises:
-        HTTPException: If credentials not found or deletion fails
+        HTTPException: If no credentials are found
     """
-    # Verify credentials exist before attempting delete
-    existing_creds = get_creds_by_org(
-        session=session,
-        org_id=org_id,
-        project_id=project_id,
-    )
-    if existing_creds is None or len(existing_creds) == 0:
-        raise HTTPException(
-            status_code=404, detail="No credentials found for this organization"
-        )
-    expected_count = len(existing_creds)
+    # A single DELETE; its rowcount doubles as the existence check
     statement = delete(Credential).where(
         Credential.organization_id == org_id,
         Credential.project_id == project_id,
@@ -280,17 +308,12 @@ def remove_creds_for_org(*, session: Session, org_id: int, project_id: int) -> N
     result = session.exec(statement)
 
     rows_deleted = result.rowcount
-
-    if rows_deleted < expected_count:
-        logger.error(
-            f"[remove_creds_for_org] Failed to delete all credentials | organization_id {org_id}, project_id {project_id}, expected {expected_count}, deleted {rows_deleted}"
-        )
-        session.rollback()
+    if rows_deleted == 0:
         raise HTTPException(
-            status_code=500,
-            detail="Failed to delete all credentials",
+            status_code=404, detail="No credentials found for this organization"
         )
     session.commit()
+    invalidate_credential_cache(org_id, project_id)
     logger.info(
         f"[remove_creds_for_org] Successfully deleted {rows_deleted} credential(s) | organization_id {org_id}, project_id {project_id}"
     )
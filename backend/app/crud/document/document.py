@@ -1,6 +1,7 @@
 import logging
 from uuid import UUID
 
+from sqlalchemy import update
 from sqlmodel import Session, select, and_
 
 from app.models import Document
@@ -122,12 +123,26 @@ class DocumentCrud:
         return document
 
     def delete(self, doc_id: UUID):
-        document = self.read_one(doc_id)
-        document.is_deleted = True
-        document.deleted_at = now()
-        document.updated_at = now()
+        # One UPDATE ... RETURNING instead of read, update and refresh
+        timestamp = now()
+        statement = (
+            update(Document)
+            .where(
+                Document.id == doc_id,
+                Document.project_id == self.project_id,
+                Document.is_deleted.is_(False),
+            )
+            .values(is_deleted=True, deleted_at=timestamp, updated_at=timestamp)
+            .returning(Document)
+        )
+        updated_document = self.session.exec(statement).scalar_one_or_none()
+        if updated_document is None:
+            logger.warning(
+                f"[DocumentCrud.delete] Document not found | {{'doc_id': '{doc_id}', 'project_id': {self.project_id}}}"
+            )
+            raise HTTPException(status_code=404, detail="Document not found")
 
-        updated_document = self.update(document)
+        self.session.commit()
         logger.info(
             f"[DocumentCrud.delete] Document deleted successfully | {{'doc_id': '{doc_id}', 'project_id': {self.project_id}}}"
         )
@@ -1,26 +1,32 @@
 from typing import Optional
 
+from sqlalchemy import insert
 from sqlmodel import Session, select
 
 from app.models import Document, Collection, DocumentCollection
 
+INSERT_BATCH_SIZE = 2000
+
 
 class DocumentCollectionCrud:
     def __init__(self, session: Session):
         self.session = session
 
-    def create(self, collection: Collection, documents: list[Document]):
-        document_collection = []
-        for d in documents:
-            dc = DocumentCollection(
-                document_id=d.id,
-                collection_id=collection.id,
-            )
-            document_collection.append(dc)
-
-        self.session.bulk_save_objects(document_collection)
+    def create(
+        self,
+        collection: Collection,
+        documents: list[Document],
+        batch_size: int = INSERT_BATCH_SIZE,
+    ):
+        # Chunked so very large collections keep bounded parameter buffers;
+        # all chunks share one transaction and a single commit
+        for i in range(0, len(documents), batch_size):
+            rows = [
+                {"document_id": d.id, "collection_id": collection.id}
+                for d in documents[i : i + batch_size]
+            ]
+            self.session.exec(insert(DocumentCollection), params=rows)
         self.session.commit()
-        self.session.refresh(collection)
 
     def read(
         self,
@@ -37,9 +37,6 @@ def create_batch_job(
 
     try:
         batch_job = BatchJob.model_validate(batch_job_create)
-        batch_job.inserted_at = now()
-        batch_job.updated_at = now()
-
         session.add(batch_job)
         session.commit()
         session.refresh(batch_job)
@@ -5,7 +5,6 @@ from sqlmodel import Session, select
 from fastapi import HTTPException
 
 from app.models import Organization, OrganizationCreate
-from app.core.util import now
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +13,6 @@ def create_organization(
     *, session: Session, org_create: OrganizationCreate
 ) -> Organization:
     db_org = Organization.model_validate(org_create)
-    db_org.inserted_at = now()
-    db_org.updated_at = now()
     session.add(db_org)
     session.commit()
     session.refresh(db_org)
@@ -37,21 +34,22 @@ def get_organization_by_name(*, session: Session, name: str) -> Optional[Organiz
 
 
 # Validate if organization exists and is active
-def validate_organization(session: Session, org_id: int) -> Organization:
+def validate_organization(session: Session, org_id: int) -> None:
     """
     Ensures that an organization exists and is active.
+    Only the is_active column is read; use get_organization_by_id when the
+    Organization object itself is needed.
     """
-    organization = get_organization_by_id(session, org_id)
-    if not organization:
+    statement = select(Organization.is_active).where(Organization.id == org_id)
+    is_active = session.exec(statement).first()
+    if is_active is None:
         logger.error(
             f"[validate_organization] Organization not found | 'org_id': {org_id}"
         )
         raise HTTPException(404, "Organization not found")
 
-    if not organization.is_active:
+    if not is_active:
         logger.error(
             f"[validate_organization] Organization is not active | 'org_id': {org_id}"
         )
-        raise HTTPException("Organization is not active")
-
-    return organization
+        raise HTTPException(400, "Organization is not active")
@@ -5,7 +5,6 @@ from sqlmodel import Session, select
 from fastapi import HTTPException
 
 from app.models import Project, ProjectCreate, Organization
-from app.core.util import now
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +22,6 @@ def create_project(*, session: Session, project_create: ProjectCreate) -> Projec
         raise HTTPException(409, "Project already exists")
 
     db_project = Project.model_validate(project_create)
-    db_project.inserted_at = now()
-    db_project.updated_at = now()
     session.add(db_project)
     session.commit()
     session.refresh(db_project)
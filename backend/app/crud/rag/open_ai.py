@@ -1,6 +1,7 @@
 import json
 import logging
 import functools as ft
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable
 
 from openai import OpenAI, OpenAIError
@@ -12,18 +13,31 @@ from app.models import Document
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent object-store reads when preparing an upload batch
+STREAM_WORKERS = 8
+# Upper bound on concurrent file lookups when reporting a partial upload
+FILE_RETRIEVE_WORKERS = 8
+
 
 def vs_ls(client: OpenAI, vector_store_id: str):
-    kwargs = {}
-    while True:
-        page = client.vector_stores.files.list(
+    def fetch(**kwargs):
+        return client.vector_stores.files.list(
             vector_store_id=vector_store_id,
             **kwargs,
         )
-        yield from page
-        if not page.has_more:
-            break
-        kwargs["after"] = page.last_id
+
+    # Request the next page while the caller consumes the current one.
+    # Iterate page.data: iterating the page itself would auto-paginate.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        page = fetch()
+        while True:
+            next_page = (
+                executor.submit(fetch, after=page.last_id) if page.has_more else None
+            )
+            yield from page.data
+            if next_page is None:
+                break
+            page = next_page.result()
 
 
 class BaseModelEncoder(json.JSONEncoder):
@@ -33,7 +47,7 @@ class BaseModelEncoder(json.JSONEncoder):
 
     @default.register
     def _(self, o: BaseModel):
-        return o.model_dump()
+        return o.model_dump(mode="json")
 
 
 class ResourceCleaner:
@@ -121,55 +135,84 @@ class OpenAIVectorStoreCrud(OpenAICrud):
         storage: CloudStorage,
         documents: Iterable[Document],
     ):
-        files = []
         for docs in documents:
-            for d in docs:
-                f_obj = storage.stream(d.object_store_url)
+            files = self._stream_files(storage, docs)
+            try:
+                logger.info(
+                    f"[OpenAIVectorStoreCrud.update] Uploading files to vector store | {{'vector_store_id': '{vector_store_id}', 'file_count': {len(files)}}}"
+                )
+                req = self.client.vector_stores.file_batches.upload_and_poll(
+                    vector_store_id=vector_store_id,
+                    files=files,
+                )
+                logger.info(
+                    f"[OpenAIVectorStoreCrud.update] File upload completed | {{'vector_store_id': '{vector_store_id}', 'completed_files': {req.file_counts.completed}, 'total_files': {req.file_counts.total}}}"
+                )
+                if req.file_counts.completed != req.file_counts.total:
+                    # Vector store entries carry no filename, so resolve the
+                    # successful ones concurrently and diff by name once
+                    succeeded = [
+                        i.id for i in self.read(vector_store_id) if i.last_error is None
+                    ]
+                    with ThreadPoolExecutor(
+                        max_workers=FILE_RETRIEVE_WORKERS
+                    ) as executor:
+                        uploaded = {
+                            f.filename
+                            for f in executor.map(self.client.files.retrieve, succeeded)
+                        }
+
+                    error = {
+                        "error": "OpenAI document processing error",
+                        "documents": [d for d in docs if d.fname not in uploaded],
+                    }
+                    try:
+                        raise InterruptedError(json.dumps(error, cls=BaseModelEncoder))
+                    except InterruptedError as err:
+                        logger.error(
+                            f"[OpenAIVectorStoreCrud.update] Document processing error | {{'vector_store_id': '{vector_store_id}', 'error': '{error['error']}', 'failed_documents': {len(error['documents'])}}}",
+                            exc_info=True,
+                        )
+                        raise
+            finally:
+                while files:
+                    f_obj = files.pop()
+                    f_obj.close()
+                    logger.info(
+                        f"[OpenAIVectorStoreCrud.update] Closed file stream | {{'vector_store_id': '{vector_store_id}', 'filename': '{f_obj.name}'}}"
+                    )
 
-                # monkey patch botocore.response.StreamingBody to make
-                # OpenAI happy
-                f_obj.name = d.fname
+            yield from docs
 
-                files.append(f_obj)
+    @staticmethod
+    def _stream_files(storage: CloudStorage, docs: list[Document]) -> list:
+        # Opening each object is a network round trip, so open the batch
+        # concurrently rather than one document at a time
+        with ThreadPoolExecutor(max_workers=STREAM_WORKERS) as executor:
+            futures = [
+                executor.submit(storage.stream, d.object_store_url) for d in docs
+            ]
+
+        failed = next((f for f in futures if f.exception() is not None), None)
+        if failed is not None:
+            # Every stream has been opened by now, so close all of the ones
+            # that succeeded before surfacing the failure
+            for future in futures:
+                if future.exception() is None:
+                    future.result().close()
+            raise failed.exception()
 
-            logger.info(
-                f"[OpenAIVectorStoreCrud.update] Uploading files to vector store | {{'vector_store_id': '{vector_store_id}', 'file_count': {len(files)}}}"
-            )
-            req = self.client.vector_stores.file_batches.upload_and_poll(
-                vector_store_id=vector_store_id,
-                files=files,
-            )
-            logger.info(
-                f"[OpenAIVectorStoreCrud.update] File upload completed | {{'vector_store_id': '{vector_store_id}', 'completed_files': {req.file_counts.completed}, 'total_files': {req.file_counts.total}}}"
-            )
-            if req.file_counts.completed != req.file_counts.total:
-                view = {x.fname: x for x in docs}
-                for i in self.read(vector_store_id):
-                    if i.last_error is None:
-                        fname = self.client.files.retrieve(i.id)
-                        view.pop(fname)
-
-                error = {
-                    "error": "OpenAI document processing error",
-                    "documents": list(view.values()),
-                }
-                try:
-                    raise InterruptedError(json.dumps(error, cls=BaseModelEncoder))
-                except InterruptedError as err:
-                    logger.error(
-                        f"[OpenAIVectorStoreCrud.update] Document processing error | {{'vector_store_id': '{vector_store_id}', 'error': '{error['error']}', 'failed_documents': {len(error['documents'])}}}",
-                        exc_info=True,
-                    )
-                    raise
+        files = []
+        for d, future in zip(docs, futures):
+            f_obj = future.result()
 
-            while files:
-                f_obj = files.pop()
-                f_obj.close()
-                logger.info(
-                    f"[OpenAIVectorStoreCrud.update] Closed file stream | {{'vector_store_id': '{vector_store_id}', 'filename': '{f_obj.name}'}}"
-                )
+            # monkey patch botocore.response.StreamingBody to make
+            # OpenAI happy
+            f_obj.name = d.fname
 
-            yield from docs
+            files.append(f_obj)
+
+        return files
 
     def delete(self, vector_store_id: str, retries: int = 3):
         if retries < 1:
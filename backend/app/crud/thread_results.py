@@ -1,6 +1,7 @@
 import logging
+from sqlalchemy.dialects.postgresql import insert
 from sqlmodel import Session, select
-from datetime import datetime
+from app.core.util import now
 from app.models import OpenAIThreadCreate, OpenAI_Thread
 from app.utils import mask_string
 
@@ -8,25 +9,27 @@ logger = logging.getLogger(__name__)
 
 
 def upsert_thread_result(session: Session, data: OpenAIThreadCreate):
-    statement = select(OpenAI_Thread).where(OpenAI_Thread.thread_id == data.thread_id)
-    existing = session.exec(statement).first()
-
-    if existing:
-        existing.prompt = data.prompt
-        existing.response = data.response
-        existing.status = data.status
-        existing.error = data.error
-        existing.updated_at = datetime.utcnow()
-        logger.info(
-            f"[upsert_thread_result] Updated existing thread result in the db with ID: {mask_string(data.thread_id)}"
-        )
-    else:
-        new_thread = OpenAI_Thread(**data.dict())
-        session.add(new_thread)
-        logger.info(
-            f"[upsert_thread_result] Created new thread result in the db with ID: {mask_string(new_thread.thread_id)}"
-        )
+    # Single atomic round trip on the unique thread_id instead of
+    # SELECT followed by UPDATE or INSERT
+    timestamp = now()
+    statement = insert(OpenAI_Thread).values(
+        **data.model_dump(), inserted_at=timestamp, updated_at=timestamp
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[OpenAI_Thread.thread_id],
+        set_={
+            "prompt": statement.excluded.prompt,
+            "response": statement.excluded.response,
+            "status": statement.excluded.status,
+            "error": statement.excluded.error,
+            "updated_at": statement.excluded.updated_at,
+        },
+    )
+    session.exec(statement)
     session.commit()
+    logger.info(
+        f"[upsert_thread_result] Upserted thread result in the db with ID: {mask_string(data.thread_id)}"
+    )
 
 
 def get_thread_result(session: Session, thread_id: str) -> OpenAI_Thread | None:
@@ -1,3 +1,6 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import sentry_sdk
 
 from fastapi import FastAPI
@@ -5,6 +8,7 @@ from fastapi.routing import APIRoute
 from fastapi.openapi.utils import get_openapi
 from asgi_correlation_id.middleware import CorrelationIdMiddleware
 from app.api.main import api_router
+from app.api.routes.threads import start_thread_run_workers, stop_thread_run_workers
 from app.api.docs.openapi_config import tags_metadata, customize_openapi_schema
 from app.core.config import settings
 from app.core.exception_handlers import register_exception_handlers
@@ -23,8 +27,17 @@ def custom_generate_unique_id(route: APIRoute) -> str:
 if settings.SENTRY_DSN and settings.ENVIRONMENT != "development":
     sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    workers = start_thread_run_workers(app)
+    yield
+    await stop_thread_run_workers(app, workers)
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
+    lifespan=lifespan,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
     description="**Responsible AI for the development sector**",
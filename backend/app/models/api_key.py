@@ -1,6 +1,7 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
+from sqlalchemy import Index, text
 from sqlmodel import Field, SQLModel
 
 from app.core.util import now
@@ -56,6 +57,14 @@ class APIKeyVerifyResponse(SQLModel):
 class APIKey(APIKeyBase, table=True):
     """Database model for API keys."""
 
+    __table_args__ = (
+        Index(
+            "idx_apikey_project_id_active",
+            "project_id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
+
     id: UUID = Field(
         default_factory=uuid4,
         primary_key=True,
@@ -71,7 +80,9 @@ class APIKey(APIKeyBase, table=True):
     )
     key_hash: str = Field(
         nullable=False,
-        sa_column_kwargs={"comment": "Bcrypt hash of the secret of the API key"},
+        sa_column_kwargs={
+            "comment": "HMAC-SHA256 hash of the secret of the API key (bcrypt for legacy keys)"
+        },
     )
     is_deleted: bool = Field(
         default=False,
@@ -84,7 +84,6 @@ class Credential(CredsBase, table=True):
         sa_column_kwargs={"comment": "Unique ID for the credential"},
     )
     provider: str = Field(
-        index=True,
         nullable=False,
         description="Provider name like 'openai', 'google'",
         sa_column_kwargs={"comment": "Provider name like 'openai', 'google'"},
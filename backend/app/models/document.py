@@ -1,6 +1,7 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
+from sqlalchemy import Index, text
 from sqlmodel import Field, SQLModel
 
 from app.core.util import now
@@ -28,6 +29,14 @@ class DocumentBase(SQLModel):
 class Document(DocumentBase, table=True):
     """Database model for documents."""
 
+    __table_args__ = (
+        Index(
+            "idx_document_project_id_active",
+            "project_id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
+
     id: UUID = Field(
         default_factory=uuid4,
         primary_key=True,
@@ -184,7 +184,8 @@ def clear_database(session: Session) -> None:
     session.exec(delete(Project))
     session.exec(delete(Organization))
     session.exec(delete(User))
-    session.commit()
+    # No commit here: the deletes join seed_database's single transaction,
+    # so a failed seed rolls back to the previous data
     logging.info("[seed_data] Existing database cleared")
 
 
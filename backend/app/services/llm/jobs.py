@@ -89,7 +89,7 @@ def handle_job_error(
         if callback_url:
             send_callback(
                 callback_url=callback_url,
-                data=callback_response.model_dump(),
+                data=callback_response,
             )
 
         job_crud.update(
@@ -444,7 +444,7 @@ def execute_job(
             if callback_url_str:
                 send_callback(
                     callback_url=callback_url_str,
-                    data=callback_response.model_dump(),
+                    data=callback_response,
                 )
 
             with Session(engine) as session:
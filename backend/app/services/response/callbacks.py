@@ -1,3 +1,5 @@
+from pydantic import BaseModel
+
 from app.models import ResponsesAPIRequest, ResponsesSyncAPIRequest
 from app.utils import APIResponse, send_callback
 
@@ -22,16 +24,14 @@ def send_response_callback(
 ) -> None:
     """Send a standardized callback response to the provided callback URL."""
 
-    callback_response = callback_response.model_dump()
+    additional_data = get_additional_data(request_dict)
+    data = callback_response.data
+    if data is None or additional_data:
+        # Extra request fields are merged into data, which needs a plain dict
+        dumped = data.model_dump() if isinstance(data, BaseModel) else data or {}
+        data = {**dumped, **additional_data}
+
     send_callback(
         callback_url,
-        {
-            "success": callback_response.get("success", False),
-            "data": {
-                **(callback_response.get("data") or {}),
-                **get_additional_data(request_dict),
-            },
-            "error": callback_response.get("error"),
-            "metadata": None,
-        },
+        callback_response.model_copy(update={"data": data, "metadata": None}),
     )
@@ -1,18 +1,24 @@
 import uuid
+import asyncio
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 import openai
 from openai import OpenAIError
 from sqlmodel import select
 
+from fastapi import FastAPI
+
 from app.api.routes.threads import (
     process_run,
-    validate_thread,
     setup_thread,
     process_message_content,
     handle_openai_error,
     poll_run_and_prepare_response,
+    run_and_poll_thread,
+    start_thread_run_workers,
+    stop_thread_run_workers,
 )
 from app.models import OpenAI_Thread
 from app.crud import get_thread_result
@@ -117,7 +123,7 @@ def test_process_run_variants(
     # Simulate a completed run.
     mock_run = MagicMock()
     mock_run.status = "completed"
-    mock_client.beta.threads.runs.create_and_poll.return_value = mock_run
+    mock_client.beta.threads.runs.create.return_value = mock_run
 
     # Set up the dummy message based on the remove_citation flag.
     base_message = "Glific is an open-source, two-way messaging platform designed for nonprofits to scale their outreach via WhatsApp"
@@ -135,10 +141,10 @@ def test_process_run_variants(
         mock_send_callback.assert_called_once()
         callback_url, payload = mock_send_callback.call_args[0]
         assert callback_url == request["callback_url"]
-        assert payload["data"]["message"] == expected_message
-        assert payload["data"]["status"] == "success"
-        assert payload["data"]["thread_id"] == "thread_123"
-        assert payload["success"] is True
+        assert payload.data["message"] == expected_message
+        assert payload.data["status"] == "success"
+        assert payload.data["thread_id"] == "thread_123"
+        assert payload.success is True
 
 
 @patch("app.api.routes.threads.configure_openai")
@@ -152,10 +158,17 @@ def test_threads_sync_endpoint_active_run(
     mock_get_provider_credential.return_value = {"api_key": "dummy_api_key"}
     mock_configure_openai.return_value = (mock_client, True)
 
-    # Simulate active run
-    mock_run = MagicMock()
-    mock_run.status = "in_progress"
-    mock_client.beta.threads.runs.list.return_value = MagicMock(data=[mock_run])
+    # Simulate OpenAI rejecting the message because a run is active
+    error_message = (
+        "Can't add messages to existing_thread while a run run_123 is active."
+    )
+    mock_client.beta.threads.messages.create.side_effect = openai.BadRequestError(
+        message=error_message,
+        response=httpx.Response(
+            400, request=httpx.Request("POST", "https://api.openai.com")
+        ),
+        body={"message": error_message},
+    )
 
     request_data = {
         "question": "Test question",
@@ -169,6 +182,7 @@ def test_threads_sync_endpoint_active_run(
             "/api/v1/threads/sync", json=request_data, headers=user_api_key_header
         )
     assert "active run" in str(excinfo.value).lower()
+    mock_client.beta.threads.runs.list.assert_not_called()
 
 
 @patch("app.api.routes.threads.configure_openai")
@@ -200,7 +214,7 @@ def test_threads_sync_endpoint_success(
     mock_run.usage.completion_tokens = 20
     mock_run.usage.total_tokens = 30
     mock_run.model = "gpt-4"
-    mock_client.beta.threads.runs.create_and_poll.return_value = mock_run
+    mock_client.beta.threads.runs.create.return_value = mock_run
 
     # Simulate message retrieval
     dummy_message = MagicMock()
@@ -226,89 +240,6 @@ def test_threads_sync_endpoint_success(
     assert response_json["data"]["diagnostics"]["total_tokens"] == 30
 
 
-def test_validate_thread_no_thread_id():
-    """Test validate_thread when no thread_id is provided."""
-    mock_client = MagicMock()
-    is_valid, error = validate_thread(mock_client, None)
-    assert is_valid is True
-    assert error is None
-
-
-def test_validate_thread_invalid_thread():
-    """Test validate_thread with an invalid thread_id."""
-    mock_client = MagicMock()
-    error = openai.OpenAIError()
-    error.message = "Invalid thread"
-    error.response = MagicMock(status_code=404)
-    error.body = {"message": "Invalid thread"}
-    mock_client.beta.threads.runs.list.side_effect = error
-
-    is_valid, error = validate_thread(mock_client, "invalid_thread")
-    assert is_valid is False
-    assert "Invalid thread ID" in error
-
-
-def test_validate_thread_with_active_run():
-    """Test validate_thread when there is an active run."""
-    mock_client = MagicMock()
-    mock_run = MagicMock()
-    mock_run.status = "in_progress"
-    mock_client.beta.threads.runs.list.return_value = MagicMock(data=[mock_run])
-
-    is_valid, error = validate_thread(mock_client, "thread_123")
-    assert is_valid is False
-    assert "active run" in error.lower()
-    assert "in_progress" in error
-
-
-def test_validate_thread_with_queued_run():
-    """Test validate_thread when there is a queued run."""
-    mock_client = MagicMock()
-    mock_run = MagicMock()
-    mock_run.status = "queued"
-    mock_client.beta.threads.runs.list.return_value = MagicMock(data=[mock_run])
-
-    is_valid, error = validate_thread(mock_client, "thread_123")
-    assert is_valid is False
-    assert "active run" in error.lower()
-    assert "queued" in error
-
-
-def test_validate_thread_with_requires_action_run():
-    """Test validate_thread when there is a run requiring action."""
-    mock_client = MagicMock()
-    mock_run = MagicMock()
-    mock_run.status = "requires_action"
-    mock_client.beta.threads.runs.list.return_value = MagicMock(data=[mock_run])
-
-    is_valid, error = validate_thread(mock_client, "thread_123")
-    assert is_valid is False
-    assert "active run" in error.lower()
-    assert "requires_action" in error
-
-
-def test_validate_thread_with_completed_run():
-    """Test validate_thread when there is a completed run."""
-    mock_client = MagicMock()
-    mock_run = MagicMock()
-    mock_run.status = "completed"
-    mock_client.beta.threads.runs.list.return_value = MagicMock(data=[mock_run])
-
-    is_valid, error = validate_thread(mock_client, "thread_123")
-    assert is_valid is True
-    assert error is None
-
-
-def test_validate_thread_with_no_runs():
-    """Test validate_thread when there are no runs."""
-    mock_client = MagicMock()
-    mock_client.beta.threads.runs.list.return_value = MagicMock(data=[])
-
-    is_valid, error = validate_thread(mock_client, "thread_123")
-    assert is_valid is True
-    assert error is None
-
-
 def test_setup_thread_new_thread():
     """Test setup_thread for creating a new thread."""
     mock_client = MagicMock()
@@ -337,6 +268,45 @@ def test_setup_thread_existing_thread():
     assert error is None
 
 
+def _bad_request_error(message: str) -> openai.BadRequestError:
+    return openai.BadRequestError(
+        message=message,
+        response=httpx.Response(
+            400, request=httpx.Request("POST", "https://api.openai.com")
+        ),
+        body={"message": message},
+    )
+
+
+def test_setup_thread_existing_thread_with_active_run():
+    """Test setup_thread when OpenAI rejects the message because a run is active."""
+    mock_client = MagicMock()
+    mock_client.beta.threads.messages.create.side_effect = _bad_request_error(
+        "Can't add messages to existing_thread while a run run_123 is active."
+    )
+
+    request = {"question": "Test question", "thread_id": "existing_thread"}
+    is_success, error = setup_thread(mock_client, request)
+
+    assert is_success is False
+    assert "active run" in error
+    mock_client.beta.threads.runs.list.assert_not_called()
+
+
+def test_setup_thread_existing_thread_bad_request():
+    """Test setup_thread passes through other bad request errors unchanged."""
+    mock_client = MagicMock()
+    mock_client.beta.threads.messages.create.side_effect = _bad_request_error(
+        "No thread found with id 'existing_thread'."
+    )
+
+    request = {"question": "Test question", "thread_id": "existing_thread"}
+    is_success, error = setup_thread(mock_client, request)
+
+    assert is_success is False
+    assert error == "No thread found with id 'existing_thread'."
+
+
 def test_process_message_content():
     """Test process_message_content with and without citation removal."""
     message = "Test message【1:2†citation】"
@@ -408,6 +378,60 @@ def test_handle_openai_error_with_none_body():
     assert result == "None body error"
 
 
+@patch("app.api.routes.threads.time.sleep")
+def test_run_and_poll_thread_backs_off_until_terminal(mock_sleep):
+    """Test run_and_poll_thread retrieves the run with growing intervals."""
+    mock_client = MagicMock()
+    mock_client.beta.threads.runs.create.return_value = MagicMock(
+        id="run_1", status="queued"
+    )
+    mock_client.beta.threads.runs.retrieve.side_effect = [
+        MagicMock(id="run_1", status="in_progress"),
+        MagicMock(id="run_1", status="in_progress"),
+        MagicMock(id="run_1", status="completed"),
+    ]
+
+    run = run_and_poll_thread(mock_client, "thread_123", "assistant_123")
+
+    assert run.status == "completed"
+    assert mock_client.beta.threads.runs.retrieve.call_count == 3
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.2, 0.4, 0.8]
+
+
+@pytest.mark.asyncio
+@patch("app.api.routes.threads.process_run")
+async def test_thread_run_workers_process_queued_runs(mock_process_run):
+    """Queued runs are picked up by the workers and run on the dedicated executor."""
+    app = FastAPI()
+    workers = start_thread_run_workers(app)
+    request = {"thread_id": "thread_123", "callback_url": "http://example.com"}
+    client, tracer = MagicMock(), MagicMock()
+
+    await app.state.thread_run_queue.put((request, client, tracer))
+    await asyncio.wait_for(app.state.thread_run_queue.join(), timeout=5)
+    await stop_thread_run_workers(app, workers)
+
+    mock_process_run.assert_called_once_with(request, client, tracer)
+    assert all(worker.done() for worker in workers)
+
+
+@pytest.mark.asyncio
+@patch("app.api.routes.threads.process_run")
+async def test_stop_thread_run_workers_logs_dropped_runs(mock_process_run, caplog):
+    """Runs still queued at shutdown are drained and logged instead of lost silently."""
+    app = FastAPI()
+    workers = start_thread_run_workers(app)
+    for worker in workers:
+        worker.cancel()
+    await app.state.thread_run_queue.put(({"thread_id": "thread_123"}, None, None))
+
+    await stop_thread_run_workers(app, workers)
+
+    mock_process_run.assert_not_called()
+    assert app.state.thread_run_queue.empty()
+    assert "Dropping queued run on shutdown" in caplog.text
+
+
 @patch("app.api.routes.threads.configure_openai")
 @patch("app.api.routes.threads.get_provider_credential")
 def test_poll_run_and_prepare_response_completed(
@@ -416,7 +440,7 @@ def test_poll_run_and_prepare_response_completed(
     mock_client = MagicMock()
     mock_run = MagicMock()
     mock_run.status = "completed"
-    mock_client.beta.threads.runs.create_and_poll.return_value = mock_run
+    mock_client.beta.threads.runs.create.return_value = mock_run
 
     mock_message = MagicMock()
     mock_message.content = [MagicMock(text=MagicMock(value="Answer"))]
@@ -444,7 +468,7 @@ def test_poll_run_and_prepare_response_openai_error_handling(
 ):
     mock_client = MagicMock()
     mock_error = OpenAIError("Simulated OpenAI error")
-    mock_client.beta.threads.runs.create_and_poll.side_effect = mock_error
+    mock_client.beta.threads.runs.create.side_effect = mock_error
     mock_get_provider_credential.return_value = {"api_key": "dummy_api_key"}
     mock_configure_openai.return_value = (mock_client, True)
 
@@ -475,7 +499,7 @@ def test_poll_run_and_prepare_response_non_completed(
 ):
     mock_client = MagicMock()
     mock_run = MagicMock(status="failed")
-    mock_client.beta.threads.runs.create_and_poll.return_value = mock_run
+    mock_client.beta.threads.runs.create.return_value = mock_run
     mock_get_provider_credential.return_value = {"api_key": "dummy_api_key"}
     mock_configure_openai.return_value = (mock_client, True)
 
@@ -0,0 +1,12 @@
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+
+
+def test_health_check(client: TestClient) -> None:
+    for _ in range(2):
+        response = client.get(f"{settings.API_V1_STR}/utils/health/")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() is True
@@ -12,6 +12,7 @@ from typing import Any, Generator
 # Now import after setting environment
 from app.core.config import settings
 from app.core.db import engine
+from app.crud.credentials import clear_credential_cache
 from app.api.deps import get_db
 from app.main import app
 from app.tests.utils.user import authentication_token_from_email
@@ -45,6 +46,14 @@ def db() -> Generator[Session, None, None]:
         connection.close()
 
 
+@pytest.fixture(autouse=True)
+def reset_credential_cache() -> Generator[None, None, None]:
+    """Each test rolls back its data, so cached credentials must not leak across tests."""
+    clear_credential_cache()
+    yield
+    clear_credential_cache()
+
+
 @pytest.fixture(scope="session", autouse=True)
 def seed_baseline() -> Generator[None, None, None]:
     """
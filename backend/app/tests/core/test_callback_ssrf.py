@@ -1,3 +1,4 @@
+import json
 import socket
 from typing import Any
 import requests
@@ -5,7 +6,12 @@ from unittest.mock import patch, MagicMock
 
 import pytest
 
-from app.utils import _is_private_ip, validate_callback_url, send_callback
+from app.utils import (
+    APIResponse,
+    _is_private_ip,
+    validate_callback_url,
+    send_callback,
+)
 
 
 class TestIsPrivateIP:
@@ -326,5 +332,23 @@ class TestSendCallback:
         send_callback("https://api.example.com/callback", test_data)
 
         call_kwargs = mock_session.post.call_args[1]
-        assert "json" in call_kwargs
-        assert call_kwargs["json"] == test_data
+        assert json.loads(call_kwargs["data"]) == test_data
+        assert call_kwargs["headers"]["Content-Type"] == "application/json"
+
+    @patch("app.utils.validate_callback_url")
+    @patch("requests.Session")
+    def test_callback_serializes_pydantic_model(
+        self, mock_session_class: Any, mock_validate: Any
+    ) -> None:
+        """Test that a pydantic model payload is serialized without model_dump."""
+        mock_session = MagicMock()
+        mock_response = MagicMock()
+        mock_response.raise_for_status.return_value = None
+        mock_session.post.return_value = mock_response
+        mock_session_class.return_value.__enter__.return_value = mock_session
+
+        payload = APIResponse.success_response(data={"status": "completed"})
+        send_callback("https://api.example.com/callback", payload)
+
+        call_kwargs = mock_session.post.call_args[1]
+        assert json.loads(call_kwargs["data"]) == payload.model_dump(mode="json")
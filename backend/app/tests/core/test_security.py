@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from sqlmodel import Session
 
 from app.core.security import (
@@ -57,12 +59,22 @@ class TestAPIKeyManager:
         assert prefix1 != prefix2
         assert hash1 != hash2
 
-    def test_generate_hash_is_bcrypt(self):
-        """Test that the generated hash uses bcrypt format."""
+    def test_generate_hash_is_hmac_sha256(self):
+        """Test that the generated hash is a hex HMAC-SHA256 of the secret."""
         raw_key, key_prefix, key_hash = APIKeyManager.generate()
+        _, secret = APIKeyManager._extract_key_parts(raw_key)
+
+        assert len(key_hash) == 64
+        assert key_hash == APIKeyManager._hash_secret(secret)
 
-        # bcrypt hashes start with $2b$ (or $2a$ or $2y$)
-        assert key_hash.startswith("$2")
+    def test_verify_secret_accepts_legacy_bcrypt_hash(self):
+        """Test that keys hashed with bcrypt before the switch still verify."""
+        secret = "l" * 43
+        legacy_hash = APIKeyManager.pwd_context.hash(secret)
+
+        assert legacy_hash.startswith(APIKeyManager.LEGACY_HASH_PREFIX)
+        assert APIKeyManager._verify_secret(secret, legacy_hash) is True
+        assert APIKeyManager._verify_secret("w" * 43, legacy_hash) is False
 
     def test_extract_key_parts_new_format(self):
         """Test extracting key parts from new format (65 chars)."""
@@ -172,6 +184,24 @@ class TestAPIKeyManager:
                 auth_context = APIKeyManager.verify(db, malformed_key)
                 assert auth_context is None
 
+    def test_verify_secret_caches_successful_checks(self):
+        """Test that a verified secret skips bcrypt on the next check."""
+        secret = "s" * 43
+        key_hash = APIKeyManager.pwd_context.hash(secret)
+
+        assert APIKeyManager._verify_secret(secret, key_hash) is True
+
+        with patch.object(APIKeyManager.pwd_context, "verify") as mock_verify:
+            assert APIKeyManager._verify_secret(secret, key_hash) is True
+            mock_verify.assert_not_called()
+
+    def test_verify_secret_does_not_cache_failures(self):
+        """Test that a wrong secret is re-checked and never cached."""
+        key_hash = APIKeyManager.pwd_context.hash("s" * 43)
+
+        assert APIKeyManager._verify_secret("w" * 43, key_hash) is False
+        assert APIKeyManager._verify_secret("w" * 43, key_hash) is False
+
     def test_prefix_name_constant(self):
         """Test that PREFIX_NAME is correct."""
         assert APIKeyManager.PREFIX_NAME == "ApiKey "
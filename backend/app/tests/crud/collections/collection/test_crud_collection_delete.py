@@ -1,3 +1,5 @@
+import pytest
+from fastapi import HTTPException
 import openai_responses
 from openai import OpenAI
 from sqlmodel import Session, select
@@ -88,3 +90,57 @@ class TestCollectionDelete:
         crud.delete(documents[0], assistant)
 
         assert all(y.deleted_at for (_, y) in resources)
+
+    def test_delete_document_keeps_collections_whose_remote_delete_failed(
+        self, db: Session
+    ) -> None:
+        project = get_project(db)
+        store = DocumentStore(db, project_id=project.id)
+        documents = store.fill(1)
+
+        crud = CollectionCrud(db, project_id=project.id)
+        collections = [
+            crud.create(
+                Collection(
+                    project_id=project.id,
+                    llm_service_id=f"asst_{i}",
+                    llm_service_name="gpt-4o",
+                    provider=ProviderType.openai,
+                ),
+                documents,
+            )
+            for i in range(self._n_collections)
+        ]
+        failing = collections[0].llm_service_id
+
+        class Remote:
+            def delete(self, llm_service_id: str) -> None:
+                if llm_service_id == failing:
+                    raise RuntimeError("remote failure")
+
+        with pytest.raises(RuntimeError):
+            crud.delete(documents[0], Remote())
+
+        (first, *rest) = collections
+        assert first.deleted_at is None
+        assert all(c.deleted_at for c in rest)
+
+    def test_delete_by_id_marks_deleted(self, db: Session) -> None:
+        project = get_project(db)
+        crud = CollectionCrud(db, project_id=project.id)
+        collection = crud.create(
+            Collection(
+                project_id=project.id,
+                llm_service_id="asst_delete_by_id",
+                llm_service_name="gpt-4o",
+                provider=ProviderType.openai,
+            )
+        )
+
+        deleted = crud.delete_by_id(collection.id)
+
+        assert deleted.id == collection.id
+        assert deleted.deleted_at is not None
+        with pytest.raises(HTTPException) as exc:
+            crud.delete_by_id(collection.id)
+        assert exc.value.status_code == 404
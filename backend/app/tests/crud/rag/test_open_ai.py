@@ -0,0 +1,90 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.crud.rag import OpenAIVectorStoreCrud
+from app.crud.rag.open_ai import vs_ls
+from app.models import Document
+
+
+def test_stream_files_closes_opened_streams_on_failure() -> None:
+    docs = [
+        SimpleNamespace(fname=f"doc{i}.pdf", object_store_url=f"s3://bucket/doc{i}")
+        for i in range(5)
+    ]
+    streams = {}
+
+    def stream(url):
+        if url == "s3://bucket/doc2":
+            raise ConnectionError("object store unavailable")
+        streams[url] = MagicMock()
+        return streams[url]
+
+    storage = MagicMock()
+    storage.stream.side_effect = stream
+
+    with pytest.raises(ConnectionError):
+        OpenAIVectorStoreCrud._stream_files(storage, docs)
+
+    assert len(streams) == 4
+    for f_obj in streams.values():
+        f_obj.close.assert_called_once()
+
+
+def test_vs_ls_yields_each_file_once_across_pages() -> None:
+    pages = {
+        None: SimpleNamespace(
+            data=[SimpleNamespace(id="file_1"), SimpleNamespace(id="file_2")],
+            has_more=True,
+            last_id="file_2",
+        ),
+        "file_2": SimpleNamespace(
+            data=[SimpleNamespace(id="file_3")],
+            has_more=False,
+            last_id="file_3",
+        ),
+    }
+    client = MagicMock()
+    client.vector_stores.files.list.side_effect = (
+        lambda vector_store_id, after=None: pages[after]
+    )
+
+    files = [f.id for f in vs_ls(client, "vs_123")]
+
+    assert files == ["file_1", "file_2", "file_3"]
+    assert client.vector_stores.files.list.call_count == 2
+
+
+def test_update_reports_only_failed_documents() -> None:
+    docs = [
+        Document(fname=fname, project_id=1, object_store_url=f"s3://bucket/{fname}")
+        for fname in ("a.pdf", "b.pdf", "c.pdf")
+    ]
+    storage = MagicMock()
+    storage.stream.side_effect = lambda url: MagicMock()
+
+    client = MagicMock()
+    client.vector_stores.file_batches.upload_and_poll.return_value = SimpleNamespace(
+        file_counts=SimpleNamespace(completed=2, total=3)
+    )
+    vector_store_files = [
+        SimpleNamespace(id="file_a", last_error=None),
+        SimpleNamespace(id="file_b", last_error={"code": "server_error"}),
+        SimpleNamespace(id="file_c", last_error=None),
+    ]
+    filenames = {"file_a": "a.pdf", "file_b": "b.pdf", "file_c": "c.pdf"}
+    client.files.retrieve.side_effect = lambda file_id: SimpleNamespace(
+        filename=filenames[file_id]
+    )
+
+    crud = OpenAIVectorStoreCrud(client)
+    with patch.object(
+        OpenAIVectorStoreCrud, "read", return_value=vector_store_files
+    ), pytest.raises(InterruptedError) as exc:
+        list(crud.update("vs_123", storage, [docs]))
+
+    error = json.loads(str(exc.value))
+    assert [d["fname"] for d in error["documents"]] == ["b.pdf"]
+    assert client.files.retrieve.call_count == 2
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 from sqlmodel import Session
 
@@ -5,10 +7,12 @@ from app.crud import (
     set_creds_for_org,
     get_creds_by_org,
     get_provider_credential,
+    get_key_by_org,
     update_creds_for_org,
     remove_provider_credential,
     remove_creds_for_org,
 )
+from fastapi import HTTPException
 from app.models import CredsCreate, CredsUpdate
 from app.core.providers import Provider
 from app.tests.utils.test_data import (
@@ -110,6 +114,35 @@ def test_get_provider_credential(db: Session) -> None:
     assert retrieved_cred["api_key"] == original_api_key
 
 
+def test_get_key_by_org(db: Session) -> None:
+    """Test retrieving only the decrypted API key for a provider."""
+    credentials_create = test_credential_data(db)
+    original_api_key = credentials_create.credential[Provider.OPENAI.value]["api_key"]
+
+    project = create_test_project(db)
+    set_creds_for_org(
+        session=db,
+        creds_add=credentials_create,
+        organization_id=project.organization_id,
+        project_id=project.id,
+    )
+
+    api_key = get_key_by_org(
+        session=db, org_id=project.organization_id, project_id=project.id
+    )
+
+    assert api_key == original_api_key
+    assert (
+        get_key_by_org(
+            session=db,
+            org_id=project.organization_id,
+            project_id=project.id,
+            provider="google",
+        )
+        is None
+    )
+
+
 def test_update_creds_for_org(db: Session) -> None:
     """Test updating credentials for a provider."""
     _, project = create_test_credential(db)
@@ -142,6 +175,44 @@ def test_update_creds_for_org(db: Session) -> None:
     assert retrieved_cred["api_key"] == "updated-key"
 
 
+def test_get_provider_credential_cache_invalidated_on_update(db: Session) -> None:
+    """Test that a cached credential is dropped when the credential changes."""
+    _, project = create_test_credential(db)
+
+    first = get_provider_credential(
+        session=db,
+        org_id=project.organization_id,
+        provider="openai",
+        project_id=project.id,
+    )
+    first["api_key"] = "mutated-by-caller"
+
+    with patch("app.crud.credentials.decrypt_credentials") as mock_decrypt:
+        cached = get_provider_credential(
+            session=db,
+            org_id=project.organization_id,
+            provider="openai",
+            project_id=project.id,
+        )
+        mock_decrypt.assert_not_called()
+    assert cached["api_key"] != "mutated-by-caller"
+
+    update_creds_for_org(
+        session=db,
+        org_id=project.organization_id,
+        creds_in=CredsUpdate(provider="openai", credential={"api_key": "rotated"}),
+        project_id=project.id,
+    )
+
+    retrieved_cred = get_provider_credential(
+        session=db,
+        org_id=project.organization_id,
+        provider="openai",
+        project_id=project.id,
+    )
+    assert retrieved_cred["api_key"] == "rotated"
+
+
 def test_remove_provider_credential(db: Session) -> None:
     """Test removing credentials for a specific provider."""
     _, project = create_test_credential(db)
@@ -251,6 +322,88 @@ def test_duplicate_provider_credentials(db: Session) -> None:
     assert existing_creds["api_key"] == "test-key"
 
 
+def test_set_credentials_validation_failure_writes_nothing(db: Session) -> None:
+    """Test that an invalid provider later in the payload stores no credentials."""
+    project = create_test_project(db)
+
+    credentials_create = CredsCreate(
+        is_active=True,
+        credential={
+            "openai": {"api_key": "test-key"},
+            "langfuse": {"public_key": "test-public-key"},
+        },
+    )
+
+    with pytest.raises(ValueError):
+        set_creds_for_org(
+            session=db,
+            creds_add=credentials_create,
+            organization_id=project.organization_id,
+            project_id=project.id,
+        )
+
+    assert (
+        get_provider_credential(
+            session=db,
+            org_id=project.organization_id,
+            provider="openai",
+            project_id=project.id,
+        )
+        is None
+    )
+
+
+def test_set_credentials_conflict_keeps_other_providers(db: Session) -> None:
+    """Test that a duplicate provider is skipped and the other providers are stored."""
+    project = create_test_project(db)
+
+    set_creds_for_org(
+        session=db,
+        creds_add=CredsCreate(
+            is_active=True, credential={"openai": {"api_key": "test-key"}}
+        ),
+        organization_id=project.organization_id,
+        project_id=project.id,
+    )
+
+    credentials_create = CredsCreate(
+        is_active=True,
+        credential={
+            "openai": {"api_key": "another-key"},
+            "langfuse": {
+                "public_key": "test-public-key",
+                "secret_key": "test-secret-key",
+                "host": "https://cloud.langfuse.com",
+            },
+        },
+    )
+
+    with pytest.raises(HTTPException, match="'openai' already exist"):
+        set_creds_for_org(
+            session=db,
+            creds_add=credentials_create,
+            organization_id=project.organization_id,
+            project_id=project.id,
+        )
+
+    langfuse_creds = get_provider_credential(
+        session=db,
+        org_id=project.organization_id,
+        provider="langfuse",
+        project_id=project.id,
+    )
+    assert langfuse_creds is not None
+    assert langfuse_creds["public_key"] == "test-public-key"
+
+    openai_creds = get_provider_credential(
+        session=db,
+        org_id=project.organization_id,
+        provider="openai",
+        project_id=project.id,
+    )
+    assert openai_creds["api_key"] == "test-key"
+
+
 def test_langfuse_credential_validation(db: Session) -> None:
     """Test validation of Langfuse credentials structure."""
     project = create_test_project(db)
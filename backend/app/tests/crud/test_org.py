@@ -1,6 +1,12 @@
+import pytest
+from fastapi import HTTPException
 from sqlmodel import Session
 
-from app.crud.organization import create_organization, get_organization_by_id
+from app.crud.organization import (
+    create_organization,
+    get_organization_by_id,
+    validate_organization,
+)
 from app.models import Organization, OrganizationCreate
 from app.tests.utils.utils import random_lower_string, get_non_existent_id
 from app.tests.utils.test_data import create_test_organization
@@ -32,3 +38,31 @@ def test_get_non_existent_organization(db: Session) -> None:
     organization_id = get_non_existent_id(db, Organization)
     fetched_org = get_organization_by_id(session=db, org_id=organization_id)
     assert fetched_org is None
+
+
+def test_validate_organization(db: Session) -> None:
+    """Test that an active organization passes validation."""
+    organization = create_test_organization(db)
+
+    validate_organization(session=db, org_id=organization.id)
+
+
+def test_validate_organization_not_found(db: Session) -> None:
+    """Test that validation fails with a 404 for a non-existent organization."""
+    organization_id = get_non_existent_id(db, Organization)
+
+    with pytest.raises(HTTPException, match="Organization not found") as exc:
+        validate_organization(session=db, org_id=organization_id)
+    assert exc.value.status_code == 404
+
+
+def test_validate_organization_inactive(db: Session) -> None:
+    """Test that validation fails with a 400 when the organization is inactive."""
+    organization = create_organization(
+        session=db,
+        org_create=OrganizationCreate(name=random_lower_string(), is_active=False),
+    )
+
+    with pytest.raises(HTTPException, match="Organization is not active") as exc:
+        validate_organization(session=db, org_id=organization.id)
+    assert exc.value.status_code == 400
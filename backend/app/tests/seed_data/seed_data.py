@@ -10,7 +10,7 @@ from sqlmodel import Session, delete, select
 
 from app.core.db import engine
 from app.core import settings
-from app.core.security import get_password_hash, encrypt_credentials
+from app.core.security import encrypt_credentials
 from app.models import (
     APIKey,
     Organization,
@@ -22,6 +22,10 @@ from app.models import (
     Language,
 )
 
+# Seed secrets only guard throwaway test rows, so hash them at bcrypt's
+# minimum cost; verification reads the rounds from the hash itself
+seed_pwd_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4)
+
 
 class OrgData(BaseModel):
     name: str
@@ -142,7 +146,7 @@ def create_user(session: Session, user_data_raw: dict[str, Any]) -> User:
     """Create a user from data."""
     try:
         user_data = UserData.model_validate(user_data_raw)
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = seed_pwd_context.hash(user_data.password)
         user = User(
             email=user_data.email,
             full_name=user_data.full_name,
@@ -193,8 +197,7 @@ def create_api_key(session: Session, api_key_data_raw: dict[str, Any]) -> APIKey
 
         key_prefix = key_portion[:12]
 
-        pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-        key_hash = pwd_context.hash(key_portion[12:])
+        key_hash = seed_pwd_context.hash(key_portion[12:])
 
         api_key = APIKey(
             organization_id=organization.id,
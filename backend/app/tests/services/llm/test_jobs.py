@@ -147,9 +147,9 @@ class TestHandleJobError:
             assert call_args[1]["callback_url"] == callback_url
 
             callback_data = call_args[1]["data"]
-            assert callback_data["success"] is False
-            assert callback_data["error"] == callback_response.error
-            assert callback_data["data"] is None
+            assert callback_data.success is False
+            assert callback_data.error == callback_response.error
+            assert callback_data.data is None
 
             db.refresh(job)
             assert job.status == JobStatus.FAILED
@@ -395,7 +395,7 @@ class TestExecuteJob:
 
         env["send_callback"].assert_called_once()
         callback_data = env["send_callback"].call_args[1]["data"]
-        assert callback_data["metadata"] == {"tracking_id": "track-123"}
+        assert callback_data.metadata == {"tracking_id": "track-123"}
 
     def test_metadata_in_error_callback(
         self, db, job_env, job_for_execution, request_data
@@ -411,7 +411,7 @@ class TestExecuteJob:
 
         env["send_callback"].assert_called_once()
         callback_data = env["send_callback"].call_args[1]["data"]
-        assert callback_data["metadata"] == {"tracking_id": "track-456"}
+        assert callback_data.metadata == {"tracking_id": "track-456"}
 
     def test_stored_config_success(self, db, job_for_execution, mock_llm_response):
         """Test successful execution with stored config (id + version)."""
@@ -506,7 +506,7 @@ class TestExecuteJob:
             # Verify callback was sent
             mock_send_callback.assert_called_once()
             callback_data = mock_send_callback.call_args[1]["data"]
-            assert callback_data["success"]
+            assert callback_data.success
 
             # Verify success
             assert result["success"]
@@ -640,7 +640,7 @@ class TestExecuteJob:
 
             mock_send_callback.assert_called_once()
             callback_data = mock_send_callback.call_args[1]["data"]
-            assert callback_data["success"]
+            assert callback_data.success
             assert result["success"]
             db.refresh(job_for_execution)
             assert job_for_execution.status == JobStatus.SUCCESS
@@ -0,0 +1,69 @@
+import json
+from unittest.mock import patch
+
+from pydantic_core import to_json
+
+from app.models import CallbackResponse
+from app.services.response.callbacks import send_response_callback
+from app.utils import APIResponse
+
+
+def _sent_payload(callback_response: APIResponse, request_dict: dict) -> dict:
+    with patch("app.services.response.callbacks.send_callback") as mock_send_callback:
+        send_response_callback(
+            "https://example.com/callback", callback_response, request_dict
+        )
+    _, payload = mock_send_callback.call_args.args
+    return json.loads(to_json(payload))
+
+
+def test_send_response_callback_passes_model_through() -> None:
+    callback_response = APIResponse.success_response(
+        data=CallbackResponse(status="success", response_id="resp_123", message="Hi"),
+        metadata={"tracking_id": "track-123"},
+    )
+
+    payload = _sent_payload(
+        callback_response, {"assistant_id": "asst_123", "question": "Hello?"}
+    )
+
+    assert payload == {
+        "success": True,
+        "data": {
+            "status": "success",
+            "response_id": "resp_123",
+            "message": "Hi",
+            "diagnostics": None,
+        },
+        "error": None,
+        "metadata": None,
+    }
+
+
+def test_send_response_callback_merges_additional_data() -> None:
+    callback_response = APIResponse.success_response(
+        data=CallbackResponse(status="success", response_id="resp_123", message="Hi")
+    )
+
+    payload = _sent_payload(
+        callback_response,
+        {"assistant_id": "asst_123", "question": "Hello?", "chat_id": "chat_1"},
+    )
+
+    assert payload["data"]["response_id"] == "resp_123"
+    assert payload["data"]["chat_id"] == "chat_1"
+
+
+def test_send_response_callback_failure_sends_empty_data() -> None:
+    callback_response = APIResponse.failure_response(error="Something went wrong")
+
+    payload = _sent_payload(
+        callback_response, {"assistant_id": "asst_123", "question": "Hello?"}
+    )
+
+    assert payload == {
+        "success": False,
+        "data": {},
+        "error": "Something went wrong",
+        "metadata": None,
+    }
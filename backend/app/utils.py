@@ -23,6 +23,7 @@ from langfuse import Langfuse
 import openai
 from openai import OpenAI
 from pydantic import BaseModel
+from pydantic_core import to_json
 from sqlmodel import Session
 
 from app.core import security
@@ -353,7 +354,7 @@ def validate_callback_url(url: str) -> None:
         raise ValueError(f"Error validating callback URL: {str(e)}") from e
 
 
-def send_callback(callback_url: str, data: dict[str, Any]) -> bool:
+def send_callback(callback_url: str, data: dict[str, Any] | BaseModel) -> bool:
     """
     Send results to the callback URL (synchronously) with SSRF protection.
 
@@ -368,7 +369,7 @@ def send_callback(callback_url: str, data: dict[str, Any]) -> bool:
 
     Args:
         callback_url: The HTTPS URL to send the callback to
-        data: The JSON data to send in the POST request
+        data: The JSON data (dict or pydantic model) to send in the POST request
 
     Returns:
         bool: True if callback succeeded, False otherwise
@@ -380,12 +381,15 @@ def send_callback(callback_url: str, data: dict[str, Any]) -> bool:
         return False
 
     try:
+        # Serialize once in pydantic-core rather than via stdlib json in requests
+        body = to_json(data)
         with requests.Session() as session:
             session.trust_env = False  # Ignores environment proxies and other implicit settings for SSRF safety
 
             response = session.post(
                 callback_url,
-                json=data,
+                data=body,
+                headers={"Content-Type": "application/json"},
                 timeout=(
                     settings.CALLBACK_CONNECT_TIMEOUT,
                     settings.CALLBACK_READ_TIMEOUT,